@@ -1,44 +1,110 @@
 from __future__ import annotations
 
+import asyncio
 import base64
+import hashlib
+import importlib.util
 import os
-from typing import Any, Dict, List, Optional
+from collections import OrderedDict
+from typing import Any, AsyncIterable, AsyncIterator, Dict, Iterable, List, Optional, Tuple
 
-from ollama import Client
+import httpx
+from ollama import AsyncClient
+
+# Keep connections to Ollama alive between calls so vision/planning requests
+# don't pay a fresh TCP (and TLS) handshake each time.
+_HTTP_LIMITS = httpx.Limits(max_keepalive_connections=40, max_connections=100, keepalive_expiry=30.0)
+# Only connecting is bounded by default: like ollama's own client, a slow generation
+# (e.g. a vision model on a CPU-only host) is not cut off. OLLAMA_TIMEOUT sets a cap.
+_HTTP_TIMEOUT = httpx.Timeout(None, connect=10.0)
+
+# Static instructions go first and per-request fields last, so consecutive
+# prompts share a token prefix that Ollama can serve from its KV cache.
+_VISION_PREAMBLE = (
+    "Analyze this UI screenshot.\n"
+    "Describe the visible interactive elements, their approximate locations, and the overall context. "
+    "If you see a button, input field, or text, describe it and its approximate location."
+    "Example: 'There is a button labeled 'Submit' in the bottom right corner of the screen at (100, 100)."
+    "Be specific about buttons, input fields, and text. Also include coordinates for each element."
+    "When getting coordinates, use the center of the element."
+)
+_PLAN_PREAMBLE = (
+    "Based on the UI state and the goal below, determine the single next immediate action to take. "
+    "Return the plan in a clear, step-by-step format. "
+    "If you need to click something, specify the element and its approximate location (center of the element). "
+    "If you need to type something, specify the text."
+)
 
 
 class AIClient:
     """Client for interacting with Ollama models for vision and reasoning."""
 
-    def __init__(self, vision_model: str = "llama3.2-vision", planning_model: str = "llama3.2"):
+    def __init__(
+        self,
+        vision_model: str = "llama3.2-vision",
+        planning_model: str = "llama3.2",
+        *,
+        temperature: float | None = None,
+        cache_size: int = 256,
+    ):
+        """
+        ``temperature`` is only sent to Ollama when set, here or through OLLAMA_TEMPERATURE;
+        left unset, each model's own default applies. Responses are cached only at an
+        explicit temperature of 0, the one setting where they are reproducible.
+        """
         self.vision_model = os.getenv("OLLAMA_VISION_MODEL", vision_model)
         self.planning_model = os.getenv("OLLAMA_PLANNING_MODEL", planning_model)
-        self.client = Client(host=os.getenv("OLLAMA_BASE_URL", "http://localhost:11434"))
+        env_temperature = os.getenv("OLLAMA_TEMPERATURE")
+        self.temperature = float(env_temperature) if env_temperature else temperature
+        self.cache_size = cache_size
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self._cache: OrderedDict[str, str] = OrderedDict()
+        host = os.getenv("OLLAMA_BASE_URL", "http://localhost:11434")
+        # httpx only negotiates HTTP/2 over TLS, and needs the optional `h2` package for it.
+        http2 = host.startswith("https://") and importlib.util.find_spec("h2") is not None
+        request_timeout = os.getenv("OLLAMA_TIMEOUT")
+        timeout = httpx.Timeout(float(request_timeout), connect=10.0) if request_timeout else _HTTP_TIMEOUT
+        self.client = AsyncClient(host=host, timeout=timeout, limits=_HTTP_LIMITS, http2=http2)
+        self._warmed_up = False
+
+    async def warm_up(self) -> None:
+        """
+        Open the pooled connection and have Ollama load the vision model.
 
-    def analyze_image(self, image_data: str, instruction: str = "") -> str:
+        Only the first call does anything. Callers can run it alongside work that
+        has to happen before the first analysis anyway (such as the screen capture)
+        so the model load overlaps with it instead of following it.
+        """
+        if self._warmed_up:
+            return
+        self._warmed_up = True
+        try:
+            # A generate request without a prompt just loads the model
+            await self.client.generate(model=self.vision_model)
+        except Exception:
+            # Not fatal; the real request will surface any connection problem
+            pass
+
+    async def analyze_image(self, image_data: bytes | str, instruction: str = "") -> str:
         """
         Analyze an image using a vision model.
 
         Args:
-            image_data: Base64 encoded image data.
+            image_data: Raw encoded image bytes, or the same image as a base64 string.
             instruction: Optional instruction to focus the analysis.
 
         Returns:
             A text description of the image and UI elements.
         """
-        prompt = (
-            f"Analyze this UI screenshot. {instruction}\n"
-            "Describe the visible interactive elements, their approximate locations, and the overall context. "
-            "If you see a button, input field, or text, describe it and its approximate location."
-            "Example: 'There is a button labeled 'Submit' in the bottom right corner of the screen at (100, 100)."
-            "Be specific about buttons, input fields, and text. Also include coordinates for each element."
-            "When getting coordinates, use the center of the element."
-        )
+        prompt = _VISION_PREAMBLE
+        if instruction:
+            prompt += f"\n\nInstruction: {instruction}"
 
         try:
-            response = self.client.chat(
-                model=self.vision_model,
-                messages=[
+            return await self._chat(
+                self.vision_model,
+                [
                     {
                         "role": "user",
                         "content": prompt,
@@ -46,11 +112,10 @@ class AIClient:
                     }
                 ],
             )
-            return response["message"]["content"]
         except Exception as e:
             return f"Error analyzing image: {str(e)}"
 
-    def plan_action(self, analysis: str, goal: str) -> str:
+    async def plan_action(self, analysis: str, goal: str) -> str:
         """
         Plan the next action based on the UI analysis and the user's goal.
 
@@ -61,25 +126,113 @@ class AIClient:
         Returns:
             A plan describing the next step and coordinates.
         """
-        prompt = (
-            f"Current UI State Analysis:\n{analysis}\n\n"
-            f"User Goal: {goal}\n\n"
-            "Based on the UI state and the goal, determine the single next immediate action to take. "
-            "Return the plan in a clear, step-by-step format. "
-            "If you need to click something, specify the element and its approximate location (center of the element). "
-            "If you need to type something, specify the text."
-        )
+        prompt = f"{_PLAN_PREAMBLE}\n\nUser Goal: {goal}\n\nCurrent UI State Analysis:\n{analysis}"
 
         try:
-            response = self.client.chat(
-                model=self.planning_model,
-                messages=[
+            return await self._chat(
+                self.planning_model,
+                [
                     {
                         "role": "user",
                         "content": prompt,
                     }
                 ],
             )
-            return response["message"]["content"]
         except Exception as e:
             return f"Error planning action: {str(e)}"
+
+    async def plan_actions_batch(self, pairs: Iterable[Tuple[str, str]]) -> List[str]:
+        """
+        Plan several actions concurrently.
+
+        Args:
+            pairs: ``(analysis, goal)`` tuples to plan for.
+
+        Returns:
+            The plans, in the same order as ``pairs``.
+        """
+        return list(await asyncio.gather(*(self.plan_action(analysis, goal) for analysis, goal in pairs)))
+
+    async def analyze_and_plan(
+        self,
+        images: AsyncIterable[bytes | str],
+        goal: str,
+        instruction: str = "",
+    ) -> AsyncIterator[Tuple[str, str]]:
+        """
+        Analyze a stream of screenshots and plan from each, pipelining the two models.
+
+        While the plan for frame N is generated, the vision model is already
+        analyzing frame N+1, so both models are busy instead of taking turns.
+
+        Args:
+            images: Screenshots (raw bytes or base64) in capture order.
+            goal: The user's ultimate goal.
+            instruction: Optional instruction to focus each analysis.
+
+        Yields:
+            ``(analysis, plan)`` for each frame, in order.
+        """
+        pending: Optional[asyncio.Task[str]] = None
+        try:
+            async for image in images:
+                previous, pending = pending, asyncio.create_task(self.analyze_image(image, instruction))
+                if previous is not None:
+                    analysis = await previous
+                    yield analysis, await self.plan_action(analysis, goal)
+            if pending is not None:
+                analysis = await pending
+                pending = None
+                yield analysis, await self.plan_action(analysis, goal)
+        finally:
+            if pending is not None:
+                pending.cancel()
+
+    def cache_info(self) -> Dict[str, int]:
+        """
+        Return hit/miss counters for the response cache.
+
+        For in-process callers and tests; the counters are not included in tool responses.
+        """
+
+        return {"hits": self.cache_hits, "misses": self.cache_misses, "size": len(self._cache)}
+
+    async def _chat(self, model: str, messages: List[Dict[str, Any]]) -> str:
+        """Send a chat request, reusing a previous answer for identical deterministic requests."""
+
+        # Responses are only reproducible at temperature 0; anything else must hit the model.
+        cacheable = self.cache_size > 0 and self.temperature == 0
+        key = ""
+        if cacheable:
+            key = _request_key(model, messages)
+            cached = self._cache.get(key)
+            if cached is not None:
+                self._cache.move_to_end(key)
+                self.cache_hits += 1
+                return cached
+            self.cache_misses += 1
+
+        response = await self.client.chat(
+            model=model,
+            messages=messages,
+            options=None if self.temperature is None else {"temperature": self.temperature},
+        )
+        content = response["message"]["content"]
+
+        if cacheable:
+            self._cache[key] = content
+            if len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        return content
+
+
+def _request_key(model: str, messages: List[Dict[str, Any]]) -> str:
+    """Hash a chat request; images are hashed as-is instead of being serialized."""
+
+    digest = hashlib.sha256(model.encode("utf-8"))
+    for message in messages:
+        digest.update(b"\0" + message["role"].encode("utf-8") + b"\0" + message["content"].encode("utf-8"))
+        for image in message.get("images", ()):
+            digest.update(b"\0")
+            digest.update(image if isinstance(image, bytes) else image.encode("ascii"))
+    return digest.hexdigest()
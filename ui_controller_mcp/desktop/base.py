@@ -4,7 +4,7 @@ from dataclasses import dataclass
 from typing import Any, Protocol
 
 
-@dataclass
+@dataclass(slots=True)
 class DesktopActionResult:
     success: bool
     message: str
@@ -16,12 +16,12 @@ class DesktopController(Protocol):
 
     def list_windows(self) -> DesktopActionResult: ...
 
-    def focus_window(self, title: str) -> DesktopActionResult: ...
+    def focus_window(self, title: str, match: str = "contains") -> DesktopActionResult: ...
 
     def click(self, x: int | None = None, y: int | None = None, button: str = "left") -> DesktopActionResult: ...
 
-    def type_text(self, text: str) -> DesktopActionResult: ...
+    def type_text(self, text: str, enter: bool = False) -> DesktopActionResult: ...
 
     def scroll(self, amount: int, direction: str = "vertical") -> DesktopActionResult: ...
 
-    def screenshot(self) -> DesktopActionResult: ...
+    def screenshot(self, encode_base64: bool = True, max_edge: int | None = None) -> DesktopActionResult: ...
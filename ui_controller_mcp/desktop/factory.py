@@ -1,10 +1,19 @@
 from __future__ import annotations
 
+import importlib.util
+from functools import lru_cache
+
 from .noop_controller import NoOpDesktopController
 from .pyautogui_controller import PyAutoGUIController
 
 
+@lru_cache(maxsize=1)
 def get_controller() -> NoOpDesktopController | PyAutoGUIController:
+    # Importing pyautogui pulls in Pillow, pyscreeze, pymsgbox, ... so skip it
+    # entirely when the package is not installed.
+    if importlib.util.find_spec("pyautogui") is None:
+        return NoOpDesktopController()
+
     controller = PyAutoGUIController()
     if controller.pyautogui is not None:
         return controller
@@ -0,0 +1,128 @@
+from __future__ import annotations
+
+import importlib
+import shutil
+import subprocess
+from typing import Callable, Iterator
+
+TextTyper = Callable[[str], None]
+
+# CGEventKeyboardSetUnicodeString only honours this many UTF-16 units per event
+_QUARTZ_CHUNK_UNITS = 20
+
+
+def resolve_fast_typer(os_name: str) -> tuple[TextTyper, str] | None:
+    """
+    Return a native typer that submits a whole string at once, plus its name.
+    Returns None when no native backend is usable on this platform.
+    """
+    try:
+        if os_name == "Windows":
+            return _windows_typer(), "sendinput"
+        if os_name == "Darwin":
+            typer = _quartz_typer()
+            return (typer, "quartz") if typer else None
+        if os_name == "Linux" and shutil.which("xdotool"):
+            return _xdotool_type, "xdotool"
+    except Exception:
+        return None
+    return None
+
+
+def _xdotool_type(text: str) -> None:
+    subprocess.run(["xdotool", "type", "--delay", "0", "--", text], check=True)
+
+
+def _quartz_typer() -> TextTyper | None:
+    try:
+        quartz = importlib.import_module("Quartz")
+    except ImportError:
+        return None
+
+    def type_text(text: str) -> None:
+        for chunk, length in _utf16_chunks(text, _QUARTZ_CHUNK_UNITS):
+            for key_down in (True, False):
+                event = quartz.CGEventCreateKeyboardEvent(None, 0, key_down)
+                quartz.CGEventKeyboardSetUnicodeString(event, length, chunk)
+                quartz.CGEventPost(quartz.kCGHIDEventTap, event)
+
+    return type_text
+
+
+def _utf16_chunks(text: str, limit: int) -> Iterator[tuple[str, int]]:
+    """
+    Split text into pieces of at most ``limit`` UTF-16 code units, yielding each with
+    its length in units. Characters outside the BMP (e.g. emoji) take two units and
+    are never split across pieces.
+    """
+    start = 0
+    units = 0
+    for index, char in enumerate(text):
+        width = 2 if ord(char) > 0xFFFF else 1
+        if units + width > limit:
+            yield text[start:index], units
+            start, units = index, 0
+        units += width
+    if units:
+        yield text[start:], units
+
+
+def _windows_typer() -> TextTyper:
+    import ctypes
+    from ctypes import wintypes
+
+    input_keyboard = 1
+    keyeventf_keyup = 0x0002
+    keyeventf_unicode = 0x0004
+    vk_return = 0x0D
+
+    class KEYBDINPUT(ctypes.Structure):
+        _fields_ = [
+            ("wVk", wintypes.WORD),
+            ("wScan", wintypes.WORD),
+            ("dwFlags", wintypes.DWORD),
+            ("time", wintypes.DWORD),
+            ("dwExtraInfo", ctypes.c_size_t),
+        ]
+
+    class MOUSEINPUT(ctypes.Structure):
+        # Only present so the union below has the size Windows expects
+        _fields_ = [
+            ("dx", wintypes.LONG),
+            ("dy", wintypes.LONG),
+            ("mouseData", wintypes.DWORD),
+            ("dwFlags", wintypes.DWORD),
+            ("time", wintypes.DWORD),
+            ("dwExtraInfo", ctypes.c_size_t),
+        ]
+
+    class _INPUTUNION(ctypes.Union):
+        _fields_ = [("ki", KEYBDINPUT), ("mi", MOUSEINPUT)]
+
+    class INPUT(ctypes.Structure):
+        _fields_ = [("type", wintypes.DWORD), ("union", _INPUTUNION)]
+
+    send_input = ctypes.windll.user32.SendInput
+
+    def type_text(text: str) -> None:
+        events = []
+        units = text.replace("\r\n", "\n").encode("utf-16-le")
+        for offset in range(0, len(units), 2):
+            unit = int.from_bytes(units[offset : offset + 2], "little")
+            for key_up in (False, True):
+                if unit in (0x0A, 0x0D):
+                    # Newlines must be sent as a real Enter key press
+                    key = KEYBDINPUT(vk_return, 0, keyeventf_keyup if key_up else 0, 0, 0)
+                else:
+                    flags = keyeventf_unicode | (keyeventf_keyup if key_up else 0)
+                    key = KEYBDINPUT(0, unit, flags, 0, 0)
+                events.append(INPUT(input_keyboard, _INPUTUNION(ki=key)))
+
+        if not events:
+            return
+        batch = (INPUT * len(events))(*events)
+        sent = send_input(len(events), batch, ctypes.sizeof(INPUT))
+        if sent != len(events):
+            raise ctypes.WinError()
+
+    return type_text
@@ -1,10 +1,13 @@
 from __future__ import annotations
 
 import platform
-from datetime import datetime
+from datetime import datetime, timezone
 
 from .base import DesktopActionResult
 
+# platform.platform() shells out to uname and parses os-release; it never changes at runtime.
+_PLATFORM = platform.platform()
+
 
 class NoOpDesktopController:
     """A safe, logging-only controller for environments without UI access."""
@@ -15,23 +18,24 @@ class NoOpDesktopController:
     def list_windows(self) -> DesktopActionResult:
         return DesktopActionResult(True, "Window listing not available; returning stub data.", data={"windows": []})
 
-    def focus_window(self, title: str) -> DesktopActionResult:
+    def focus_window(self, title: str, match: str = "contains") -> DesktopActionResult:
         return DesktopActionResult(True, f"Focus request recorded for '{title}' (noop mode)")
 
     def click(self, x: int | None = None, y: int | None = None, button: str = "left") -> DesktopActionResult:
         coords = f" at ({x}, {y})" if x is not None and y is not None else ""
         return DesktopActionResult(True, f"Click{coords} with {button} recorded (noop mode)")
 
-    def type_text(self, text: str) -> DesktopActionResult:
-        return DesktopActionResult(True, f"Typed '{text}' (noop mode)")
+    def type_text(self, text: str, enter: bool = False) -> DesktopActionResult:
+        suffix = " and pressed Enter" if enter else ""
+        return DesktopActionResult(True, f"Typed '{text}'{suffix} (noop mode)")
 
     def scroll(self, amount: int, direction: str = "vertical") -> DesktopActionResult:
         return DesktopActionResult(True, f"Scroll {direction} by {amount} recorded (noop mode)")
 
-    def screenshot(self) -> DesktopActionResult:
-        timestamp = datetime.utcnow().isoformat()
+    def screenshot(self, encode_base64: bool = True, max_edge: int | None = None) -> DesktopActionResult:
+        timestamp = datetime.now(timezone.utc).isoformat()
         return DesktopActionResult(
             True,
             "Screenshot capture not available; returning stub payload.",
-            data={"captured_at": timestamp, "platform": platform.platform()},
+            data={"captured_at": timestamp, "platform": _PLATFORM},
         )
@@ -1,15 +1,36 @@
 from __future__ import annotations
 
-import base64
 import importlib
+import io
 import platform
 import shlex
 import subprocess
-from datetime import datetime
+import threading
+import time
+from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any
+from typing import Any, ClassVar
 
+from ..utils.encoding import b64encode_ascii
+from ..utils.env import env_flag
 from .base import DesktopActionResult
+from .keyboard import TextTyper, resolve_fast_typer
+
+_OS_NAME = platform.system()
+
+# PIL.Image.BILINEAR, without importing Pillow at module load
+_BILINEAR = 2
+
+# How long a window enumeration is reused, in seconds
+_WINDOW_CACHE_TTL = 0.5
+
+# focus_window match modes, as predicates on (lowercased needle, lowercased title)
+_TITLE_MATCHERS = {
+    "contains": lambda needle, title: needle in title,
+    "starts_with": lambda needle, title: title.startswith(needle),
+    "equals": lambda needle, title: needle == title,
+}
+
 
 class PyAutoGUIController:
     """
@@ -17,22 +38,105 @@ class PyAutoGUIController:
     Uses PyAutoGUI for input/visuals and PyWinCtl for window management.
     """
 
+    _module_cache: ClassVar[dict[str, Any | None]] = {}
+
     def __init__(self) -> None:
         self.pyautogui = self._load_module("pyautogui")
         self.pywinctl = self._load_module("pywinctl")
-        self.os_name = platform.system()
+        self.os_name = _OS_NAME
+        self._windows_cache: list[tuple[str, str, Any]] | None = None
+        self._windows_cached_at = 0.0
+        self._shot_dir: Path | None = None
+        self._init_capture_backend()
+        self._init_typing_backend()
+
+    def _init_typing_backend(self) -> None:
+        """
+        Resolve a native typer that sends a whole string in one batch
+        (SendInput / Quartz / xdotool) instead of one key + sleep per character.
+        """
+        self.typing_backend = "pyautogui"
+        self._fast_typer: TextTyper | None = None
+        # UI_MCP_SAFE_TYPING: type one key at a time with a delay, as PyAutoGUI does
+        self._safe_typing = env_flag("UI_MCP_SAFE_TYPING")
+        if self._safe_typing:
+            return
+        resolved = resolve_fast_typer(self.os_name)
+        if resolved is not None:
+            self._fast_typer, self.typing_backend = resolved
+
+    def _init_capture_backend(self) -> None:
+        """
+        Pick the fastest available screen grabber.
+        DXCam reads the DXGI desktop duplication surface on Windows; mss talks to
+        XGetImage/CoreGraphics/BitBlt directly. PyAutoGUI is the fallback.
+        """
+        self.screenshot_backend = "pyautogui"
+        self._dxcam_camera: Any | None = None
+        self._dxcam_last_frame: Any | None = None
+        self.mss = None
+        self._mss_local = threading.local()
+
+        if self.os_name == "Windows":
+            dxcam = self._load_module("dxcam")
+            if dxcam is not None:
+                try:
+                    self._dxcam_camera = dxcam.create(output_color="RGB")
+                    self.screenshot_backend = "dxcam"
+                    return
+                except Exception:
+                    self._dxcam_camera = None
+
+        self.mss = self._load_module("mss")
+        if self.mss is not None:
+            self.screenshot_backend = "mss"
+
+    def _grab_image(self) -> tuple[Any, str]:
+        """Capture the entire screen as a PIL image, returning it with the backend used."""
+        if self._dxcam_camera is not None:
+            frame = self._dxcam_camera.grab()
+            # DXCam returns None when nothing changed since the previous grab
+            if frame is None:
+                frame = self._dxcam_last_frame
+            if frame is not None:
+                self._dxcam_last_frame = frame
+                from PIL import Image
+
+                return Image.fromarray(frame), "dxcam"
+        elif self.mss is not None:
+            try:
+                # mss handles are bound to the thread that created them
+                sct = getattr(self._mss_local, "sct", None)
+                if sct is None:
+                    sct = self._mss_local.sct = self.mss.mss()
+                # monitors[0] is the bounding box of every display; pyautogui's click coordinates
+                # (and dxcam's default output) refer to the primary display, which is monitors[1]
+                shot = sct.grab(sct.monitors[1])
+            except Exception:
+                # No X display, Wayland, missing permissions...: PyAutoGUI may still manage
+                self._mss_local.sct = None
+            else:
+                from PIL import Image
+
+                return Image.frombytes("RGB", shot.size, shot.bgra, "raw", "BGRX"), "mss"
+
+        return self.pyautogui.screenshot(), "pyautogui"
 
     def _load_module(self, name: str) -> Any | None:
         """Helper to safely load required modules."""
+        # Shared across instances; failed imports are remembered as None too
+        if name in self._module_cache:
+            return self._module_cache[name]
         try:
             module = importlib.import_module(name)
             if name == "pyautogui":
                 # Fail-safe triggers when mouse is in corner. 
                 # Disable for headless/server environments if needed.
                 module.FAILSAFE = False 
-            return module
         except ImportError:
-            return None
+            module = None
+        self._module_cache[name] = module
+        return module
 
     def launch_app(self, target: str) -> DesktopActionResult:
         """
@@ -68,11 +172,35 @@ class PyAutoGUIController:
             # start_new_session=True detaches the child process (POSIX)
             # creationflags=DETACHED_PROCESS (Windows) - optional refinement
             subprocess.Popen(command)
+            # A new window is about to appear
+            self._windows_cache = None
             
             return DesktopActionResult(True, f"Launched '{target}' on {self.os_name}")
         except Exception as exc:
             return DesktopActionResult(False, f"Failed to launch '{target}': {exc}")
 
+    def _windows(self) -> list[tuple[str, str, Any]]:
+        """
+        Returns (title, lowercased title, window) triples for all titled windows.
+        One enumeration is reused for a short TTL so that back-to-back
+        list_windows/focus_window calls don't each walk the window manager.
+        """
+        now = time.monotonic()
+        if self._windows_cache is not None and now - self._windows_cached_at < _WINDOW_CACHE_TTL:
+            return self._windows_cache
+
+        windows = []
+        for win in self.pywinctl.getAllWindows():
+            # Reading .title is an IPC round-trip on X11/Cocoa; do it once
+            win_title = win.title
+            if win_title and win_title.strip():
+                # Lowercased once here so focus_window's case-insensitive match doesn't redo it per call
+                windows.append((win_title, win_title.lower(), win))
+
+        self._windows_cache = windows
+        self._windows_cached_at = now
+        return windows
+
     def list_windows(self) -> DesktopActionResult:
         """
         Lists windows using PyWinCtl (Cross-platform).
@@ -81,37 +209,34 @@ class PyAutoGUIController:
             return DesktopActionResult(False, "PyWinCtl not installed/available")
 
         try:
-            # pywinctl provides a unified API for getting titles
-            all_windows = self.pywinctl.getAllTitles()
-            # Filter out empty strings
-            windows = [title for title in all_windows if title.strip()]
+            windows = [win_title for win_title, _, _ in self._windows()]
             
             return DesktopActionResult(True, "Windows listed", data={"windows": windows})
         except Exception as exc:
             return DesktopActionResult(False, f"Unable to list windows: {exc}")
 
-    def focus_window(self, title: str) -> DesktopActionResult:
+    def focus_window(self, title: str, match: str = "contains") -> DesktopActionResult:
         """
         Focuses a window using PyWinCtl.
+        match selects how the title is compared: contains, starts_with or equals.
         """
         if self.pywinctl is None:
             return DesktopActionResult(False, "PyWinCtl not installed/available")
 
+        matches = _TITLE_MATCHERS.get(match)
+        if matches is None:
+            return DesktopActionResult(False, f"Unknown match mode '{match}'")
+
         try:
-            # Find window by partial title match
-            target_window = None
-            for win_title in self.pywinctl.getAllTitles():
-                if title.lower() in win_title.lower():
-                    # Get the window object
-                    wins = self.pywinctl.getWindowsWithTitle(win_title)
-                    if wins:
-                        target_window = wins[0]
-                        break
-            
-            if target_window:
+            # Find window by case-insensitive title match
+            needle = title.lower()
+            found = next(((t, w) for t, lowered, w in self._windows() if matches(needle, lowered)), None)
+            
+            if found:
+                win_title, target_window = found
                 # Activate brings window to front and gives focus
                 target_window.activate()
-                return DesktopActionResult(True, f"Focused window '{target_window.title}'")
+                return DesktopActionResult(True, f"Focused window '{win_title}'")
             
             return DesktopActionResult(False, f"No window found matching '{title}'")
         except Exception as exc:
@@ -138,9 +263,13 @@ class PyAutoGUIController:
             return DesktopActionResult(False, "PyAutoGUI not available")
         
         try:
-            # Use write() for general text (supports all characters)
-            # interval helps prevent missing keystrokes on some OSs
-            self.pyautogui.write(text, interval=0.01)
+            if self._fast_typer is not None:
+                self._fast_typer(text)
+            elif self._safe_typing:
+                # interval helps prevent missing keystrokes on some OSs
+                self.pyautogui.write(text, interval=0.01)
+            else:
+                self.pyautogui.write(text, interval=0)
             
             if enter:
                 self.pyautogui.press("enter")
@@ -167,34 +296,73 @@ class PyAutoGUIController:
         except Exception as exc:
             return DesktopActionResult(False, f"Scroll failed: {exc}")
 
-    def screenshot(self) -> DesktopActionResult:
+    def _screenshot_dir(self) -> Path:
+        """Resolves and creates ./screenshots on first use, then reuses it."""
+        if self._shot_dir is None:
+            shot_dir = Path.cwd() / "screenshots"
+            shot_dir.mkdir(parents=True, exist_ok=True)
+            self._shot_dir = shot_dir
+        return self._shot_dir
+
+    def screenshot(self, encode_base64: bool = True, max_edge: int | None = None) -> DesktopActionResult:
+        """
+        Captures the screen. With encode_base64=False the encoded image is
+        returned as raw bytes under "image_bytes" instead of "base64_data",
+        for in-process consumers that don't need a text payload.
+        max_edge downscales the capture so its longer side fits within it.
+        """
         if self.pyautogui is None:
             return DesktopActionResult(False, "PyAutoGUI not available")
         
         try:
-            image = self.pyautogui.screenshot()
+            image, backend = self._grab_image()
+            original_size = image.size
             
-            output_dir = Path.cwd() / "screenshots"
-            output_dir.mkdir(parents=True, exist_ok=True)
+            if max_edge and max(original_size) > max_edge:
+                scale = max_edge / max(original_size)
+                resized = (max(1, round(original_size[0] * scale)), max(1, round(original_size[1] * scale)))
+                # Bilinear is several times faster than Lanczos and plenty for UI text
+                image = image.resize(resized, resample=_BILINEAR)
             
             # Use UTC now, formatted cleanly
-            captured_at = datetime.utcnow().isoformat()
-            filename = f"screenshot-{datetime.utcnow().strftime('%Y%m%dT%H%M%S')}.png"
-            file_path = output_dir / filename
-            
-            image.save(file_path)
-            
-            # Encode for transport (e.g. to an LLM or API)
-            encoded = base64.b64encode(file_path.read_bytes()).decode("ascii")
-            
-            return DesktopActionResult(
-                True,
-                "Screenshot captured",
-                data={
-                    "path": str(file_path), 
-                    "captured_at": captured_at, 
-                    "base64_data": encoded
-                },
-            )
+            now = datetime.now(timezone.utc)
+            captured_at = now.isoformat()
+            
+            # Encode in memory; WebP is far smaller than PNG for UI captures
+            buffer = io.BytesIO()
+            try:
+                image.save(buffer, format="WEBP", quality=75, method=4)
+                image_format = "webp"
+            except (KeyError, OSError):
+                # Pillow built without WebP support. zlib level 1 is several
+                # times faster than the default for ~10% larger output.
+                buffer = io.BytesIO()
+                image.save(buffer, format="PNG", optimize=False, compress_level=1)
+                image_format = "png"
+            # A view of the encoder's buffer; avoids copying the image out before base64/disk
+            content = buffer.getbuffer()
+            
+            data: dict[str, Any] = {
+                "captured_at": captured_at, 
+                "format": image_format,
+                "screenshot_backend": backend,
+            }
+            if image.size != original_size:
+                data["original_size"] = list(original_size)
+                data["resized_to"] = list(image.size)
+            if encode_base64:
+                # Encode for transport (e.g. to an API client)
+                data["base64_data"] = b64encode_ascii(content)
+            else:
+                data["image_bytes"] = bytes(content)
+            
+            # UI_MCP_PERSIST_SCREENSHOTS: also write captures to ./screenshots
+            if env_flag("UI_MCP_PERSIST_SCREENSHOTS"):
+                filename = f"screenshot-{now.strftime('%Y%m%dT%H%M%S')}.{image_format}"
+                file_path = self._screenshot_dir() / filename
+                file_path.write_bytes(content)
+                data["path"] = str(file_path)
+            
+            return DesktopActionResult(True, "Screenshot captured", data=data)
         except Exception as exc:
-            return DesktopActionResult(False, f"Screenshot failed: {exc}")
\ No newline at end of file
+            return DesktopActionResult(False, f"Screenshot failed: {exc}")
@@ -30,7 +30,7 @@ async def invoke_tool(request: Request, body: InvokeRequest) -> InvokeResponse:
         )
 
     try:
-        result = request.app.state.tool_executor.execute(body.tool, body.params)
+        result = await request.app.state.tool_executor.execute_async(body.tool, body.params)
     except ValueError as exc:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc))
 
@@ -1,12 +1,15 @@
 from __future__ import annotations
 
+import atexit
 from contextlib import asynccontextmanager
-from typing import Any, Literal
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, Awaitable, Callable, Literal
 
 from fastmcp import FastMCP
 from fastmcp.server.http import create_sse_app
 from starlette.requests import Request
-from starlette.responses import JSONResponse
+from starlette.responses import Response
 from starlette.routing import Route
 
 from ui_controller_mcp.ai.client import AIClient
@@ -14,169 +17,185 @@ from ui_controller_mcp.desktop.factory import get_controller
 from ui_controller_mcp.server.ngrok_manager import NgrokManager
 from ui_controller_mcp.tools.definitions import tool_definitions
 from ui_controller_mcp.tools.handlers import ToolExecutor
+from ui_controller_mcp.utils.env import env_flag
 from ui_controller_mcp.utils.logging import configure_logging
 from ui_controller_mcp.utils.safety import SafetyGuard
 
 logger = configure_logging()
 
-controller = get_controller()
-safety_guard = SafetyGuard()
-ai_client = AIClient()
-_tool_metadata = {tool["name"]: tool for tool in tool_definitions()}
-tool_executor = ToolExecutor(controller, safety_guard, ai_client)
-ngrok_manager = NgrokManager(port=8000)
 
+# UI_MCP_COMPACT_TOOLS advertises one-sentence tool descriptions instead of the usage guides
+_tool_metadata = MappingProxyType(
+    {tool["name"]: tool for tool in tool_definitions(verbose=not env_flag("UI_MCP_COMPACT_TOOLS"))}
+)
 
-def _tool_info(name: str) -> dict[str, Any]:
-    """Return the stored metadata for the given tool name."""
 
-    return _tool_metadata[name]
+# The desktop controller, AI client and executor are built on first use rather than at
+# import, so importing this module (e.g. to inspect tool schemas) stays cheap.
+@lru_cache(maxsize=1)
+def _safety_guard() -> SafetyGuard:
+    return SafetyGuard()
 
 
-@asynccontextmanager
-async def _lifespan(_: FastMCP):
-    """Manage optional ngrok lifecycle for the MCP server."""
+@lru_cache(maxsize=1)
+def _ai_client() -> AIClient:
+    return AIClient()
 
-    url = ngrok_manager.start()
-    if url:
-        logger.info("ngrok tunnel established: %s", url)
-        print(f"ngrok tunnel available at {url}")
 
-    try:
-        yield
-    finally:
-        ngrok_manager.stop()
+@lru_cache(maxsize=1)
+def _tool_executor() -> ToolExecutor:
+    executor = ToolExecutor(get_controller(), _safety_guard(), _ai_client())
+    # Shared by every MCP session, so its worker threads live as long as the process
+    atexit.register(executor.shutdown)
+    return executor
 
 
-server = FastMCP(
-    name="ui-controller-mcp",
-    version="0.1.0",
-    instructions="Desktop UI controller built with FastMCP.",
-    lifespan=_lifespan,
-)
+@lru_cache(maxsize=1)
+def _ngrok_manager() -> NgrokManager:
+    return NgrokManager(port=8000)
 
 
-@server.tool(
-    name="launch_app",
-    description=_tool_info("launch_app")["description"],
-    output_schema=_tool_info("launch_app")["output_schema"],
-)
-def launch_app(target: str) -> dict[str, Any]:
-    """Launch an application by name or path."""
+_LAZY_SINGLETONS: dict[str, Callable[[], Any]] = {
+    "controller": get_controller,
+    "safety_guard": _safety_guard,
+    "ai_client": _ai_client,
+    "tool_executor": _tool_executor,
+    "ngrok_manager": _ngrok_manager,
+}
 
-    return tool_executor.execute("launch_app", {"target": target})
 
+def __getattr__(name: str) -> Any:
+    """Expose the lazily built singletons under their historical module attribute names."""
 
-@server.tool(
-    name="list_windows",
-    description=_tool_info("list_windows")["description"],
-    output_schema=_tool_info("list_windows")["output_schema"],
-)
-def list_windows() -> dict[str, Any]:
-    """List currently open windows."""
+    factory = _LAZY_SINGLETONS.get(name)
+    if factory is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return factory()
 
-    return tool_executor.execute("list_windows", {})
 
+class _BoundTool:
+    """Executor handler for one tool, resolved on the first call and reused afterwards."""
 
-@server.tool(
-    name="focus_window",
-    description=_tool_info("focus_window")["description"],
-    output_schema=_tool_info("focus_window")["output_schema"],
-)
-def focus_window(title: str) -> dict[str, Any]:
-    """Focus a window by matching its title."""
+    __slots__ = ("name", "handler")
 
-    return tool_executor.execute("focus_window", {"title": title})
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self.handler: Callable[[dict[str, Any]], Awaitable[dict[str, Any]]] | None = None
 
+    async def __call__(self, params: dict[str, Any]) -> dict[str, Any]:
+        handler = self.handler
+        if handler is None:
+            handler = self.handler = _tool_executor().bind(self.name)
+        return await handler(params)
 
-@server.tool(
-    name="click",
-    description=_tool_info("click")["description"],
-    output_schema=_tool_info("click")["output_schema"],
-)
-def click(
-    x: int | None = None,
-    y: int | None = None,
-    button: Literal["left", "right", "middle"] = "left",
-) -> dict[str, Any]:
-    """Perform a mouse click at the provided coordinates."""
 
-    return tool_executor.execute("click", {"x": x, "y": y, "button": button})
+def _register(name: str) -> Callable[[Callable[..., Any]], Any]:
+    """Return the FastMCP tool decorator for ``name``, filled from its stored metadata."""
 
+    info = _tool_metadata[name]
+    return server.tool(name=name, description=info["description"], output_schema=info["output_schema"])
 
-@server.tool(
-    name="type_text",
-    description=_tool_info("type_text")["description"],
-    output_schema=_tool_info("type_text")["output_schema"],
-)
-def type_text(text: str) -> dict[str, Any]:
-    """Type text into the active window with safety checks."""
 
-    return tool_executor.execute("type_text", {"text": text})
+@asynccontextmanager
+async def _lifespan(_: FastMCP):
+    """
+    Build the tool executor up front and manage optional ngrok lifecycle for the MCP server.
 
+    FastMCP enters this once per client session, so the shared executor is not shut down
+    here; its worker pool is released at process exit instead.
+    """
 
-@server.tool(
-    name="scroll",
-    description=_tool_info("scroll")["description"],
-    output_schema=_tool_info("scroll")["output_schema"],
-)
-def scroll(
-    amount: int,
-    direction: Literal["vertical", "horizontal"] = "vertical",
-) -> dict[str, Any]:
-    """Scroll vertically or horizontally by the provided amount."""
+    _tool_executor()
+    ngrok_manager = _ngrok_manager()
+
+    url = ngrok_manager.start()
+    if url:
+        logger.info("ngrok tunnel established: %s", url)
+        print(f"ngrok tunnel available at {url}")
 
-    return tool_executor.execute("scroll", {"amount": amount, "direction": direction})
+    try:
+        yield
+    finally:
+        ngrok_manager.stop()
 
 
-@server.tool(
-    name="screenshot",
-    description=_tool_info("screenshot")["description"],
-    output_schema=_tool_info("screenshot")["output_schema"],
+server = FastMCP(
+    name="ui-controller-mcp",
+    version="0.1.0",
+    instructions="Desktop UI controller built with FastMCP.",
+    lifespan=_lifespan,
 )
-def screenshot() -> dict[str, Any]:
-    """Capture a screenshot of the current screen."""
 
-    return tool_executor.execute("screenshot", {})
 
+# Shared by every call to a parameterless tool; read-only so no handler can mutate it
+_NO_PARAMS: Any = MappingProxyType({})
 
-@server.tool(
-    name="get_bytes",
-    description=_tool_info("get_bytes")["description"],
-    output_schema=_tool_info("get_bytes")["output_schema"],
-)
-def get_bytes(path: str) -> dict[str, Any]:
-    """Read a file from disk and return its contents encoded as base64."""
+_JSON_TYPES = {"string": "str", "integer": "int", "number": "float", "boolean": "bool"}
 
-    return tool_executor.execute("get_bytes", {"path": path})
 
+def _annotation(schema: dict[str, Any]) -> str:
+    if "enum" in schema:
+        return f"Literal[{', '.join(repr(value) for value in schema['enum'])}]"
+    return _JSON_TYPES[schema["type"]]
 
-@server.tool(
-    name="perceive",
-    description=_tool_info("perceive")["description"],
-    output_schema=_tool_info("perceive")["output_schema"],
-)
-def perceive(instruction: str = "") -> dict[str, Any]:
-    """Analyze the current screen state using vision AI."""
 
-    return tool_executor.execute("perceive", {"instruction": instruction})
+def _build_tool_function(name: str, input_schema: dict[str, Any]) -> Callable[..., Awaitable[dict[str, Any]]]:
+    """
+    Compile the FastMCP entry point for a tool from its input schema.
 
+    FastMCP derives argument validation from the function signature, so each tool
+    needs a real function whose parameters mirror the schema. Generating them keeps
+    the signatures in lockstep with ``tool_definitions()``.
+    """
+
+    properties = input_schema.get("properties", {})
+    required = set(input_schema.get("required", []))
+    positional: list[str] = []
+    optional: list[str] = []
+    for param, schema in properties.items():
+        annotation = _annotation(schema)
+        if param in required:
+            positional.append(f"{param}: {annotation}")
+        elif "default" in schema:
+            optional.append(f"{param}: {annotation} = {schema['default']!r}")
+        else:
+            optional.append(f"{param}: {annotation} | None = None")
+
+    if properties:
+        arguments = "{" + ", ".join(f"{param!r}: {param}" for param in properties) + "}"
+    else:
+        arguments = "_NO_PARAMS"
+    source = (
+        f"async def {name}({', '.join(positional + optional)}) -> dict[str, Any]:\n"
+        f"    return await _bound({arguments})\n"
+    )
+    namespace: dict[str, Any] = {
+        "Any": Any,
+        "Literal": Literal,
+        "_bound": _BoundTool(name),
+        "_NO_PARAMS": _NO_PARAMS,
+    }
+    exec(compile(source, f"<tool {name}>", "exec"), namespace)
+
+    function = namespace[name]
+    function.__module__ = __name__
+    function.__doc__ = _tool_metadata[name]["description"].split("\n", 1)[0]
+    return function
+
+
+# Each tool is also exposed as a module attribute, as the hand-written wrappers were.
+for _name, _info in _tool_metadata.items():
+    globals()[_name] = _register(_name)(_build_tool_function(_name, _info["input_schema"]))
 
-@server.tool(
-    name="reason",
-    description=_tool_info("reason")["description"],
-    output_schema=_tool_info("reason")["output_schema"],
-)
-def reason(analysis: str, goal: str) -> dict[str, Any]:
-    """Plan the next action based on UI analysis and goal."""
 
-    return tool_executor.execute("reason", {"analysis": analysis, "goal": goal})
+# Responses carry no per-request state, so one pre-rendered instance serves every probe
+_HEALTH_RESPONSE = Response(b'{"status":"ok"}', media_type="application/json")
 
 
-async def health(_: Request) -> JSONResponse:  # pragma: no cover - trivial
+async def health(_: Request) -> Response:  # pragma: no cover - trivial
     """Lightweight health endpoint for container orchestrators."""
 
-    return JSONResponse({"status": "ok"})
+    return _HEALTH_RESPONSE
 
 
 app = create_sse_app(
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import os
-from typing import Optional
+from typing import Any, Optional
 
 from pyngrok import ngrok
 
@@ -10,24 +10,23 @@ class NgrokManager:
     def __init__(self, port: int) -> None:
         self.port = port
         self.tunnel: Optional[ngrok.NgrokTunnel] = None
+        # Environment is read once; start() may be called again without re-reading it
+        self._token = os.getenv("NGROK_AUTH_TOKEN")
+        self._options: dict[str, Any] = {"bind_tls": True}
+        domain = os.getenv("NGROK_DOMAIN")
+        if domain:
+            self._options["hostname"] = domain
+        self._token_applied = False
 
     def start(self) -> Optional[str]:
-        token = os.getenv("NGROK_AUTH_TOKEN")
-        if not token:
+        if not self._token:
             return None
 
-        ngrok.set_auth_token(token)
-        
-        # Build connection options
-        options = {"bind_tls": True}
-        
-        # Add domain if specified
-        domain = os.getenv("NGROK_DOMAIN")
-        if domain:
-            options["hostname"] = domain
-        
         if self.tunnel is None:
-            self.tunnel = ngrok.connect(self.port, **options)
+            if not self._token_applied:
+                ngrok.set_auth_token(self._token)
+                self._token_applied = True
+            self.tunnel = ngrok.connect(self.port, **self._options)
         
         return self.tunnel.public_url
 
@@ -0,0 +1,88 @@
+import asyncio
+
+from ui_controller_mcp.ai.client import AIClient
+
+
+class _FakeChat:
+    def __init__(self):
+        self.calls = 0
+        self.options = []
+
+    async def chat(self, model, messages, options=None):
+        self.calls += 1
+        self.options.append(options)
+        return {"message": {"content": f"plan {self.calls}"}}
+
+    async def generate(self, model):
+        self.calls += 1
+        return {"response": ""}
+
+
+def test_identical_requests_are_served_from_cache():
+    client = AIClient(temperature=0)
+    client.client = _FakeChat()
+
+    first = asyncio.run(client.plan_action("analysis", "goal"))
+    second = asyncio.run(client.plan_action("analysis", "goal"))
+
+    assert first == second == "plan 1"
+    assert client.client.calls == 1
+    assert client.cache_info()["hits"] == 1
+
+
+def test_model_default_temperature_is_not_overridden(monkeypatch):
+    monkeypatch.delenv("OLLAMA_TEMPERATURE", raising=False)
+    client = AIClient()
+    client.client = _FakeChat()
+
+    asyncio.run(client.plan_action("analysis", "goal"))
+    asyncio.run(client.plan_action("analysis", "goal"))
+
+    assert client.client.options == [None, None]
+    assert client.cache_info()["hits"] == 0
+
+
+def test_cache_is_bypassed_when_sampling():
+    client = AIClient(temperature=0.7)
+    client.client = _FakeChat()
+
+    asyncio.run(client.plan_action("analysis", "goal"))
+    asyncio.run(client.plan_action("analysis", "goal"))
+
+    assert client.client.calls == 2
+
+
+def test_analyze_and_plan_yields_one_plan_per_frame():
+    client = AIClient()
+    client.client = _FakeChat()
+
+    async def frames():
+        for frame in (b"frame-1", b"frame-2"):
+            yield frame
+
+    async def collect():
+        return [step async for step in client.analyze_and_plan(frames(), "goal")]
+
+    steps = asyncio.run(collect())
+
+    assert len(steps) == 2
+    assert client.client.calls == 4
+
+
+def test_warm_up_only_loads_the_model_once():
+    client = AIClient()
+    client.client = _FakeChat()
+
+    asyncio.run(client.warm_up())
+    asyncio.run(client.warm_up())
+
+    assert client.client.calls == 1
+
+
+def test_responses_are_awaited_without_a_deadline_unless_configured(monkeypatch):
+    monkeypatch.delenv("OLLAMA_TIMEOUT", raising=False)
+    assert AIClient().client._client.timeout.read is None
+
+    monkeypatch.setenv("OLLAMA_TIMEOUT", "600")
+    timeout = AIClient().client._client.timeout
+    assert (timeout.read, timeout.connect) == (600.0, 10.0)
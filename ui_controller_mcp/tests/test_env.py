@@ -0,0 +1,14 @@
+from ui_controller_mcp.utils.env import env_flag
+
+
+def test_env_flag_accepts_common_truthy_spellings(monkeypatch):
+    for value in ("1", "true", "YES", " True "):
+        monkeypatch.setenv("UI_MCP_TEST_FLAG", value)
+        assert env_flag("UI_MCP_TEST_FLAG")
+
+    for value in ("", "0", "false", "no", "on"):
+        monkeypatch.setenv("UI_MCP_TEST_FLAG", value)
+        assert not env_flag("UI_MCP_TEST_FLAG")
+
+    monkeypatch.delenv("UI_MCP_TEST_FLAG")
+    assert not env_flag("UI_MCP_TEST_FLAG")
@@ -0,0 +1,47 @@
+import sys
+from types import SimpleNamespace
+
+from ui_controller_mcp.desktop import keyboard
+
+
+def test_xdotool_types_the_whole_string_in_one_call(monkeypatch):
+    calls = []
+    monkeypatch.setattr(keyboard.shutil, "which", lambda name: f"/usr/bin/{name}")
+    monkeypatch.setattr(keyboard.subprocess, "run", lambda argv, **kwargs: calls.append((argv, kwargs)))
+
+    typer, backend = keyboard.resolve_fast_typer("Linux")
+    typer("-n hello")
+
+    assert backend == "xdotool"
+    assert calls == [(["xdotool", "type", "--delay", "0", "--", "-n hello"], {"check": True})]
+
+
+def test_no_native_typer_without_a_backend(monkeypatch):
+    monkeypatch.setattr(keyboard.shutil, "which", lambda name: None)
+    # A None entry makes `import Quartz` raise ImportError
+    monkeypatch.setitem(sys.modules, "Quartz", None)
+
+    assert keyboard.resolve_fast_typer("Linux") is None
+    assert keyboard.resolve_fast_typer("Darwin") is None
+    assert keyboard.resolve_fast_typer("Plan9") is None
+
+
+def test_quartz_chunks_by_utf16_units(monkeypatch):
+    posted = []
+    quartz = SimpleNamespace(
+        kCGHIDEventTap=0,
+        CGEventCreateKeyboardEvent=lambda source, keycode, key_down: {"down": key_down},
+        CGEventKeyboardSetUnicodeString=lambda event, length, text: event.update(length=length, text=text),
+        CGEventPost=lambda tap, event: posted.append(event),
+    )
+    monkeypatch.setitem(sys.modules, "Quartz", quartz)
+
+    typer, backend = keyboard.resolve_fast_typer("Darwin")
+    typer("a" * 19 + "\N{GRINNING FACE}" + "b")
+
+    assert backend == "quartz"
+    assert [(event["text"], event["length"]) for event in posted if event["down"]] == [
+        ("a" * 19, 19),
+        ("\N{GRINNING FACE}b", 3),
+    ]
+    assert all(event["length"] <= 20 for event in posted)
@@ -0,0 +1,208 @@
+import asyncio
+import base64
+import io
+from pathlib import Path
+
+import pytest
+from PIL import Image
+
+from ui_controller_mcp.desktop import pyautogui_controller
+from ui_controller_mcp.desktop.pyautogui_controller import PyAutoGUIController
+from ui_controller_mcp.tools.handlers import ToolExecutor
+from ui_controller_mcp.utils.safety import SafetyGuard
+
+
+class _FakePyAutoGUI:
+    def __init__(self, size=(2560, 1440)):
+        self.size = size
+        self.keys = []
+
+    def screenshot(self):
+        return Image.new("RGB", self.size, "white")
+
+    def write(self, text, interval=0.0):
+        self.keys.append((text, interval))
+
+    def press(self, key):
+        self.keys.append((key, None))
+
+
+class _FailingMss:
+    def mss(self):
+        raise RuntimeError("XGetImage() failed")
+
+
+class _FakeWindow:
+    def __init__(self, title):
+        self.title = title
+        self.activated = False
+
+    def activate(self):
+        self.activated = True
+
+
+class _FakePyWinCtl:
+    def __init__(self, *titles):
+        self.windows = [_FakeWindow(title) for title in titles]
+
+    def getAllWindows(self):
+        return self.windows
+
+
+class _FakeVision:
+    def __init__(self):
+        self.images = []
+
+    async def warm_up(self):
+        pass
+
+    async def analyze_image(self, image_data, instruction=""):
+        self.images.append(image_data)
+        return "OK button at (512, 288)"
+
+
+def _controller(monkeypatch, **modules):
+    """Build a controller whose optional modules are the given fakes (None when absent)."""
+    cache = {"pyautogui": _FakePyAutoGUI(), "pywinctl": None, "mss": None, "dxcam": None}
+    cache.update(modules)
+    monkeypatch.setattr(PyAutoGUIController, "_module_cache", cache)
+    monkeypatch.setattr(pyautogui_controller, "resolve_fast_typer", lambda os_name: None)
+    return PyAutoGUIController()
+
+
+def test_screenshot_falls_back_to_pyautogui_when_mss_fails(monkeypatch):
+    controller = _controller(monkeypatch, mss=_FailingMss())
+    assert controller.screenshot_backend == "mss"
+
+    result = controller.screenshot()
+
+    assert result.success
+    assert result.data["screenshot_backend"] == "pyautogui"
+
+
+def test_screenshot_downscales_to_max_edge(monkeypatch):
+    controller = _controller(monkeypatch)
+
+    result = controller.screenshot(encode_base64=False, max_edge=1024)
+
+    assert result.data["original_size"] == [2560, 1440]
+    assert result.data["resized_to"] == [1024, 576]
+    assert Image.open(io.BytesIO(result.data["image_bytes"])).size == (1024, 576)
+
+
+def test_screenshot_keeps_size_within_max_edge(monkeypatch):
+    controller = _controller(monkeypatch, pyautogui=_FakePyAutoGUI((800, 600)))
+
+    result = controller.screenshot(max_edge=1024)
+
+    assert "original_size" not in result.data
+    assert "resized_to" not in result.data
+
+
+def test_perceive_reports_scale_back_to_screen_coordinates(monkeypatch):
+    vision = _FakeVision()
+    executor = ToolExecutor(_controller(monkeypatch), SafetyGuard(), vision, vision_max_edge=1024)
+
+    try:
+        result = asyncio.run(executor.execute_async("perceive", {}))
+    finally:
+        executor.shutdown()
+
+    assert result["success"] is True
+    assert result["coordinate_scale"] == 2.5
+    assert Image.open(io.BytesIO(vision.images[0])).size == (1024, 576)
+
+
+def test_screenshot_is_encoded_as_webp_in_memory(monkeypatch, tmp_path):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.delenv("UI_MCP_PERSIST_SCREENSHOTS", raising=False)
+    controller = _controller(monkeypatch)
+
+    result = controller.screenshot()
+
+    assert result.data["format"] == "webp"
+    assert Image.open(io.BytesIO(base64.b64decode(result.data["base64_data"]))).format == "WEBP"
+    assert "path" not in result.data
+    assert not (tmp_path / "screenshots").exists()
+
+
+def test_screenshot_falls_back_to_png_without_webp(monkeypatch):
+    save = Image.Image.save
+
+    def save_without_webp(image, fp, format=None, **params):
+        if format == "WEBP":
+            raise KeyError("WEBP")
+        return save(image, fp, format=format, **params)
+
+    monkeypatch.setattr(Image.Image, "save", save_without_webp)
+    controller = _controller(monkeypatch)
+
+    result = controller.screenshot(encode_base64=False)
+
+    assert result.data["format"] == "png"
+    assert Image.open(io.BytesIO(result.data["image_bytes"])).format == "PNG"
+
+
+def test_screenshot_is_written_to_disk_only_when_enabled(monkeypatch, tmp_path):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv("UI_MCP_PERSIST_SCREENSHOTS", "1")
+    controller = _controller(monkeypatch)
+
+    result = controller.screenshot()
+
+    saved = Path(result.data["path"])
+    assert saved.parent == tmp_path / "screenshots"
+    assert saved.suffix == ".webp"
+    assert saved.read_bytes() == base64.b64decode(result.data["base64_data"])
+
+
+@pytest.mark.parametrize(
+    ("match", "title", "focused"),
+    [
+        ("contains", "report", "Quarterly Report - Editor"),
+        ("starts_with", "report", "Report Viewer"),
+        ("equals", "REPORT", "Report"),
+    ],
+)
+def test_focus_window_match_modes(monkeypatch, match, title, focused):
+    windows = _FakePyWinCtl("Quarterly Report - Editor", "Report Viewer", "Report")
+    controller = _controller(monkeypatch, pywinctl=windows)
+
+    result = controller.focus_window(title, match=match)
+
+    assert result.success
+    assert result.message == f"Focused window '{focused}'"
+    assert [window.title for window in windows.windows if window.activated] == [focused]
+
+
+def test_focus_window_reports_no_match(monkeypatch):
+    controller = _controller(monkeypatch, pywinctl=_FakePyWinCtl("Quarterly Report - Editor"))
+
+    result = controller.focus_window("Report", match="equals")
+
+    assert not result.success
+    assert "No window found" in result.message
+
+
+def test_focus_window_rejects_unknown_match_mode(monkeypatch):
+    windows = _FakePyWinCtl("Report")
+    controller = _controller(monkeypatch, pywinctl=windows)
+
+    result = controller.focus_window("Report", match="regex")
+
+    assert not result.success
+    assert result.message == "Unknown match mode 'regex'"
+    assert not windows.windows[0].activated
+
+
+def test_type_text_falls_back_to_pyautogui_without_native_typer(monkeypatch):
+    monkeypatch.delenv("UI_MCP_SAFE_TYPING", raising=False)
+    controller = _controller(monkeypatch)
+    assert controller.typing_backend == "pyautogui"
+
+    # The safe-typing choice is made once, when the controller is built
+    monkeypatch.setenv("UI_MCP_SAFE_TYPING", "1")
+    result = controller.type_text("hello", enter=True)
+
+    assert result.success
+    assert controller.pyautogui.keys == [("hello", 0), ("enter", None)]
@@ -23,3 +23,30 @@ def test_tool_schemas_propagate_to_fastmcp():
 
     assert tools["click"].output_schema["type"] == "object"
     assert tools["screenshot"].output_schema["properties"]["captured_at"]["type"] == "string"
+
+
+def test_tools_keep_working_after_a_session_ends(monkeypatch):
+    from ui_controller_mcp.desktop.noop_controller import NoOpDesktopController
+    from ui_controller_mcp.server import app
+
+    monkeypatch.delenv("NGROK_AUTH_TOKEN", raising=False)
+    monkeypatch.setattr(app, "get_controller", NoOpDesktopController)
+    app._tool_executor.cache_clear()
+    app._ngrok_manager.cache_clear()
+
+    async def two_sessions():
+        results = []
+        for _ in range(2):
+            async with app._lifespan(server):
+                tool = await server.get_tool("list_windows")
+                results.append(await tool.fn())
+        return results
+
+    try:
+        first, second = asyncio.run(two_sessions())
+    finally:
+        app._tool_executor().shutdown()
+        app._tool_executor.cache_clear()
+        app._ngrok_manager.cache_clear()
+
+    assert first["success"] and second["success"]
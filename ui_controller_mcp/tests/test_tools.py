@@ -1,6 +1,13 @@
+import asyncio
 import base64
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from pathlib import Path
 
+import pytest
+
+from ui_controller_mcp.ai.client import AIClient
 from ui_controller_mcp.desktop.noop_controller import NoOpDesktopController
 from ui_controller_mcp.tools.definitions import tool_definitions
 from ui_controller_mcp.tools.handlers import ToolExecutor
@@ -28,6 +35,28 @@ def test_tool_schemas_are_objects():
         assert tool["output_schema"]["type"] == "object"
 
 
+def test_tool_definitions_are_built_once_per_verbosity():
+    assert tool_definitions() is tool_definitions(verbose=True) is tool_definitions(True)
+    assert tool_definitions(verbose=False) is tool_definitions(False)
+    assert tool_definitions(verbose=False)[0]["input_schema"] is tool_definitions()[0]["input_schema"]
+
+
+def test_identical_schemas_are_shared():
+    definitions = {tool["name"]: tool for tool in tool_definitions()}
+
+    assert definitions["list_windows"]["input_schema"] is definitions["screenshot"]["input_schema"]
+    assert definitions["click"]["output_schema"] is definitions["scroll"]["output_schema"]
+
+
+def test_compact_definitions_keep_schemas_and_first_sentence():
+    verbose = {tool["name"]: tool for tool in tool_definitions()}
+    compact = {tool["name"]: tool for tool in tool_definitions(verbose=False)}
+
+    assert compact["click"]["description"] == "Perform a mouse click at specified coordinates or current position."
+    assert compact["click"]["input_schema"] is verbose["click"]["input_schema"]
+    assert tool_definitions(verbose=False) is tool_definitions(verbose=False)
+
+
 def test_get_bytes_encodes_file_content(tmp_path: Path):
     file_path = tmp_path / "sample.txt"
     payload = b"hello world"
@@ -42,6 +71,38 @@ def test_get_bytes_encodes_file_content(tmp_path: Path):
     assert result["data"]["base64_data"] == base64.b64encode(payload).decode("ascii")
 
 
+def test_get_bytes_rereads_changed_file(tmp_path: Path):
+    file_path = tmp_path / "sample.txt"
+    executor = ToolExecutor(NoOpDesktopController(), SafetyGuard())
+
+    file_path.write_bytes(b"first")
+    executor.execute("get_bytes", {"path": str(file_path)})
+    file_path.write_bytes(b"second version")
+    result = executor.execute("get_bytes", {"path": str(file_path)})
+
+    assert result["data"]["base64_data"] == base64.b64encode(b"second version").decode("ascii")
+
+
+@pytest.mark.skipif(not Path("/proc/self/io").exists(), reason="needs procfs")
+def test_get_bytes_reads_files_that_report_zero_size():
+    executor = ToolExecutor(NoOpDesktopController(), SafetyGuard())
+
+    # rchar counts bytes read by this process, so every read of the file changes it
+    first = executor.execute("get_bytes", {"path": "/proc/self/io"})
+    second = executor.execute("get_bytes", {"path": "/proc/self/io"})
+
+    assert first["success"] is True
+    assert base64.b64decode(first["data"]["base64_data"]).startswith(b"rchar:")
+    assert first["data"]["size"] == len(base64.b64decode(first["data"]["base64_data"]))
+    assert second["data"]["base64_data"] != first["data"]["base64_data"]
+
+    limited = ToolExecutor(NoOpDesktopController(), SafetyGuard(), max_read_size=16)
+    result = limited.execute("get_bytes", {"path": "/proc/self/status"})
+
+    assert result["success"] is False
+    assert "too large" in result["error"]
+
+
 def test_get_bytes_rejects_missing_file(tmp_path: Path):
     executor = ToolExecutor(NoOpDesktopController(), SafetyGuard())
     missing_file = tmp_path / "absent.txt"
@@ -50,3 +111,66 @@ def test_get_bytes_rejects_missing_file(tmp_path: Path):
 
     assert result["success"] is False
     assert "File not found" in result.get("error", "")
+
+
+def test_get_bytes_reports_path_through_a_file_as_missing(tmp_path: Path):
+    executor = ToolExecutor(NoOpDesktopController(), SafetyGuard())
+    (tmp_path / "sample.txt").write_bytes(b"hello")
+
+    result = executor.execute("get_bytes", {"path": str(tmp_path / "sample.txt" / "child")})
+
+    assert result["success"] is False
+    assert "File not found" in result["error"]
+
+
+def test_bound_handler_matches_execute(tmp_path: Path):
+    file_path = tmp_path / "sample.txt"
+    file_path.write_bytes(b"hello world")
+
+    executor = ToolExecutor(NoOpDesktopController(), SafetyGuard())
+    handler = executor.bind("get_bytes")
+    result = asyncio.run(handler({"path": str(file_path)}))
+
+    assert result == executor.execute("get_bytes", {"path": str(file_path)})
+
+
+def test_bind_rejects_unknown_tool():
+    executor = ToolExecutor(NoOpDesktopController(), SafetyGuard())
+
+    with pytest.raises(ValueError):
+        executor.bind("format_disk")
+
+
+class _FakeOllama(BaseHTTPRequestHandler):
+    # Keep-alive, so the client pools the connection just as it would against Ollama
+    protocol_version = "HTTP/1.1"
+
+    def do_POST(self):
+        request = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        body = json.dumps(
+            {"model": request["model"], "message": {"role": "assistant", "content": "click OK"}, "done": True}
+        ).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+def test_sync_execute_reuses_the_ai_client_across_calls(monkeypatch):
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), _FakeOllama)
+    threading.Thread(target=httpd.serve_forever, daemon=True).start()
+    monkeypatch.setenv("OLLAMA_BASE_URL", f"http://127.0.0.1:{httpd.server_port}")
+    executor = ToolExecutor(NoOpDesktopController(), SafetyGuard(), AIClient())
+
+    try:
+        first = executor.execute("reason", {"analysis": "a dialog", "goal": "dismiss it"})
+        second = executor.execute("reason", {"analysis": "a dialog", "goal": "close it"})
+    finally:
+        executor.shutdown()
+        httpd.shutdown()
+
+    assert first["plan"] == second["plan"] == "click OK"
@@ -1,14 +1,51 @@
 from __future__ import annotations
 
-from typing import Any, Callable, Dict, List
-
-from ui_controller_mcp.desktop.base import DesktopActionResult
-
-ToolHandler = Callable[[Dict[str, Any]], DesktopActionResult]
-
-
-def tool_definitions() -> List[dict[str, Any]]:
-    return [
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Callable, Dict
+
+if TYPE_CHECKING:
+    from ui_controller_mcp.desktop.base import DesktopActionResult
+
+ToolHandler = Callable[[Dict[str, Any]], "DesktopActionResult"]
+
+# Schemas that several tools share verbatim; one object each, referenced by every user.
+# Plain dicts so they serialise like the rest of the definitions; don't mutate them.
+_EMPTY_INPUT_SCHEMA: dict[str, Any] = {"type": "object", "properties": {}, "additionalProperties": False}
+
+_MESSAGE_OUTPUT_SCHEMA: dict[str, Any] = {
+    "type": "object",
+    "properties": {
+        "message": {
+            "type": "string",
+            "description": "Confirmation message",
+        }
+    },
+    "required": ["message"],
+}
+
+
+def tool_definitions(verbose: bool = True) -> tuple[dict[str, Any], ...]:
+    """
+    Return the tool schemas. Built once per process and shared by every caller,
+    so treat the result as read-only.
+    With verbose=False each description is cut down to its opening sentence,
+    which keeps tools/list small for clients that don't need the usage guides.
+    """
+    # Dispatch here rather than caching this function: lru_cache keys tool_definitions()
+    # and tool_definitions(verbose=True) separately, which would build the full set twice.
+    return _verbose_definitions() if verbose else _compact_definitions()
+
+
+@lru_cache(maxsize=1)
+def _compact_definitions() -> tuple[dict[str, Any], ...]:
+    return tuple(
+        {**tool, "description": tool["description"].split("\n\n", 1)[0]} for tool in _verbose_definitions()
+    )
+
+
+@lru_cache(maxsize=1)
+def _verbose_definitions() -> tuple[dict[str, Any], ...]:
+    return (
         {
             "name": "launch_app",
             "description": """Launch an application by name or command.
@@ -103,7 +140,7 @@ for window in windows:
     if "Firefox" in window:
         focus_window(title="Firefox")
         break""",
-            "input_schema": {"type": "object", "properties": {}, "additionalProperties": False},
+            "input_schema": _EMPTY_INPUT_SCHEMA,
             "output_schema": {
                 "type": "object",
                 "properties": {
@@ -137,6 +174,10 @@ INPUT:
   * "Firefox" - Matches "Mozilla Firefox" or "Firefox - Google"
   * "Terminal" - Matches "Terminal - bash"
   * "code" - Matches "Visual Studio Code"
+- match (optional): How the title is compared (always case-insensitive)
+  * "contains" (default) - Title appears anywhere in the window title
+  * "starts_with" - Window title begins with the given title
+  * "equals" - Window title is exactly the given title
 
 OUTPUT:
 - message: Confirmation of which window was focused, or error if not found
@@ -144,6 +185,7 @@ OUTPUT:
 BEST PRACTICES:
 - Use 'list_windows' first to see exact titles
 - Partial matches work ("Fire" matches "Firefox")
+- Use match="equals" with a title from 'list_windows' to avoid hitting a similarly named window
 - Case-insensitive matching
 - If multiple windows match, the first one is focused
 - Always focus before clicking or typing
@@ -160,6 +202,12 @@ click(x=640, y=300)""",
                         "type": "string",
                         "description": "Full or partial window title to match (case-insensitive)",
                     },
+                    "match": {
+                        "type": "string",
+                        "enum": ["contains", "starts_with", "equals"],
+                        "default": "contains",
+                        "description": "How the title is compared (default: contains)",
+                    },
                 },
                 "required": ["title"],
                 "additionalProperties": False,
@@ -236,22 +284,14 @@ perceive()  # Verify click worked""",
                     "button": {
                         "type": "string",
                         "enum": ["left", "right", "middle"],
+                        "default": "left",
                         "description": "Mouse button to click (default: left)",
                     },
                 },
                 "required": [],
                 "additionalProperties": False,
             },
-            "output_schema": {
-                "type": "object",
-                "properties": {
-                    "message": {
-                        "type": "string",
-                        "description": "Confirmation message",
-                    }
-                },
-                "required": ["message"],
-            },
+            "output_schema": _MESSAGE_OUTPUT_SCHEMA,
         },
         {
             "name": "type_text",
@@ -312,22 +352,14 @@ type_text("mypassword123", enter=True)  # Submit form""",
                     },
                     "enter": {
                         "type": "boolean",
+                        "default": False,
                         "description": "Whether to press Enter after typing (default: false)",
                     },
                 },
                 "required": ["text"],
                 "additionalProperties": False,
             },
-            "output_schema": {
-                "type": "object",
-                "properties": {
-                    "message": {
-                        "type": "string",
-                        "description": "Confirmation message",
-                    }
-                },
-                "required": ["message"],
-            },
+            "output_schema": _MESSAGE_OUTPUT_SCHEMA,
         },
         {
             "name": "scroll",
@@ -387,22 +419,14 @@ scroll(amount=-500, direction="vertical")""",
                     "direction": {
                         "type": "string",
                         "enum": ["vertical", "horizontal"],
+                        "default": "vertical",
                         "description": "Scroll direction (default: vertical)",
                     },
                 },
                 "required": ["amount"],
                 "additionalProperties": False,
             },
-            "output_schema": {
-                "type": "object",
-                "properties": {
-                    "message": {
-                        "type": "string",
-                        "description": "Confirmation message",
-                    }
-                },
-                "required": ["message"],
-            },
+            "output_schema": _MESSAGE_OUTPUT_SCHEMA,
         },
         {
             "name": "screenshot",
@@ -416,23 +440,26 @@ WHEN TO USE:
 
 HOW IT WORKS:
 - Captures the entire desktop screen
-- Saves to 'screenshots/' directory with timestamp
-- Returns both file path and base64-encoded image data
+- Encodes the image in memory (WebP, or PNG when WebP is unavailable)
+- Returns base64-encoded image data
+- Also saves to 'screenshots/' directory and returns the file path when
+  UI_MCP_PERSIST_SCREENSHOTS=1 is set on the server
 - Used internally by the 'perceive' tool
 
 INPUT:
 - No parameters required
 
 OUTPUT:
-- path: File path where screenshot was saved
+- path: File path where screenshot was saved (only when persisting is enabled)
 - captured_at: ISO timestamp of when screenshot was taken
+- format: Image encoding of base64_data ("webp" or "png")
 - base64_data: The screenshot encoded as base64 string
 
 IMPORTANT NOTES:
 - The 'perceive' tool automatically takes screenshots
 - You usually don't need to call this directly
 - Use 'perceive' instead for AI analysis of the screen
-- Screenshots are saved in the working directory
+- Screenshots are only saved to disk when UI_MCP_PERSIST_SCREENSHOTS=1
 
 BEST PRACTICES:
 - Prefer 'perceive' over raw screenshots
@@ -445,21 +472,28 @@ perceive(instruction="Analyze the screen")
 
 # But if you need the raw screenshot:
 result = screenshot()
-print(f"Screenshot saved to: {result['path']}")
 print(f"Captured at: {result['captured_at']}")
 # base64_data can be used to send image elsewhere""",
-            "input_schema": {"type": "object", "properties": {}, "additionalProperties": False},
+            "input_schema": _EMPTY_INPUT_SCHEMA,
             "output_schema": {
                 "type": "object",
                 "properties": {
                     "path": {
                         "type": "string",
-                        "description": "File path where screenshot was saved",
+                        "description": "File path where screenshot was saved (only when persisting is enabled)",
                     },
                     "captured_at": {
                         "type": "string",
                         "description": "ISO timestamp of capture time",
                     },
+                    "format": {
+                        "type": "string",
+                        "description": "Image encoding of base64_data (webp or png)",
+                    },
+                    "screenshot_backend": {
+                        "type": "string",
+                        "description": "Capture backend used (dxcam, mss or pyautogui)",
+                    },
                     "base64_data": {
                         "type": "string",
                         "description": "Screenshot image encoded as base64 string",
@@ -505,14 +539,15 @@ BEST PRACTICES:
 - Use absolute paths when possible
 - Check file exists before reading
 - Be aware of size limitations
-- Useful for reading screenshots taken by 'screenshot' tool
+- Not needed for screenshots: 'screenshot' already returns base64_data, and
+  only writes a file (with 'path') when UI_MCP_PERSIST_SCREENSHOTS=1 is set
 
 EXAMPLE:
-# Read a screenshot file
+# Re-read a saved screenshot (server started with UI_MCP_PERSIST_SCREENSHOTS=1)
 screenshot_result = screenshot()
-file_data = get_bytes(path=screenshot_result['path'])
-print(f"File size: {file_data['size']} bytes")
-# Now you have base64_data to send elsewhere
+if 'path' in screenshot_result:
+    file_data = get_bytes(path=screenshot_result['path'])
+    print(f"File size: {file_data['size']} bytes")
 
 # Read any file
 file_data = get_bytes(path="/home/user/document.pdf")
@@ -561,6 +596,7 @@ WHEN TO USE:
 
 HOW IT WORKS:
 - Captures a screenshot of the entire desktop
+- Downscales it so the longer edge is at most 1024px
 - Uses a vision model (Ollama) to analyze the image
 - Returns a detailed description of visible UI elements and their locations
 
@@ -578,6 +614,8 @@ OUTPUT:
   * Approximate locations of elements (top-left, center, bottom-right, etc.)
   * Text content visible on screen
   * Overall context and application state
+- coordinate_scale: Multiply coordinates mentioned in the analysis by this
+  factor to get screen coordinates (1.0 when the screenshot was not downscaled)
 
 BEST PRACTICES:
 - Use specific instructions to get focused analysis
@@ -595,6 +633,7 @@ EXAMPLE WORKFLOW:
                 "properties": {
                     "instruction": {
                         "type": "string",
+                        "default": "",
                         "description": "Optional specific instruction to focus the vision analysis on particular elements or aspects of the screen",
                     },
                 },
@@ -608,6 +647,10 @@ EXAMPLE WORKFLOW:
                         "type": "string",
                         "description": "Detailed description of UI elements, their locations, visible text, and overall screen context",
                     },
+                    "coordinate_scale": {
+                        "type": "number",
+                        "description": "Factor converting coordinates in the analysis to screen coordinates",
+                    },
                 },
                 "required": ["analysis"],
             },
@@ -701,4 +744,4 @@ IMPORTANT NOTES:
                 "required": ["plan"],
             },
         },
-    ]
+    )
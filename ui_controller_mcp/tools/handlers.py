@@ -1,14 +1,32 @@
 from __future__ import annotations
 
-import base64
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial
 from pathlib import Path
-from typing import Any, Dict
+from stat import S_ISREG
+from typing import Any, Awaitable, Callable, Dict
 
 from ui_controller_mcp.ai.client import AIClient
 from ui_controller_mcp.desktop.base import DesktopController
+from ui_controller_mcp.utils.encoding import b64encode_ascii
 from ui_controller_mcp.utils.safety import SafetyGuard
 
 
+@lru_cache(maxsize=16)
+def _read_base64(path: Path, mtime_ns: int, size: int) -> str:
+    """
+    Read and base64-encode a file. Keyed on modification time and size as well as
+    the path, so a rewritten file is read again rather than served from the cache.
+    """
+
+    # A bounded read rather than mmap: another process truncating a mapped file
+    # would raise SIGBUS and take the whole server down.
+    with path.open("rb") as handle:
+        return b64encode_ascii(handle.read(size))
+
+
 class ToolExecutor:
     """Executes tool invocations using the provided controller and safety guard."""
 
@@ -19,35 +37,99 @@ class ToolExecutor:
         ai_client: AIClient | None = None,
         *,
         max_read_size: int = 5 * 1024 * 1024,
+        max_workers: int = 8,
+        vision_max_edge: int | None = 1024,
     ) -> None:
         self.controller = controller
         self.safety_guard = safety_guard
         self.ai_client = ai_client
         self.max_read_size = max_read_size
+        # Vision models tile images at roughly this size anyway; sending more pixels only costs bandwidth.
+        self.vision_max_edge = vision_max_edge
+        # Desktop automation calls block; async callers run them here so the event loop stays free.
+        # Created on first use, and again after shutdown(), so a shut-down executor stays usable.
+        self._max_workers = max_workers
+        self._pool: ThreadPoolExecutor | None = None
+        # Synchronous callers of the async tools share one long-lived loop; the AI client's
+        # pooled HTTP connections are tied to the loop they were opened on.
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._loop_lock = threading.Lock()
+        self._sync_handlers: dict[str, Callable[[Dict[str, Any]], dict[str, Any]]] = {
+            "launch_app": self._launch_app,
+            "list_windows": lambda _params: self._list_windows(),
+            "focus_window": self._focus_window,
+            "click": self._click,
+            "type_text": self._type_text,
+            "scroll": self._scroll,
+            "screenshot": lambda _params: self._screenshot(),
+            "get_bytes": self._get_bytes,
+        }
+        self._async_handlers: dict[str, Callable[[Dict[str, Any]], Awaitable[dict[str, Any]]]] = {
+            "perceive": self._perceive,
+            "reason": self._reason,
+        }
+
+    def shutdown(self) -> None:
+        """Release the worker threads and background loop; later calls start fresh ones."""
+
+        pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=False, cancel_futures=True)
+        with self._loop_lock:
+            loop, self._loop = self._loop, None
+        if loop is not None:
+            loop.call_soon_threadsafe(loop.stop)
 
     def execute(self, name: str, params: Dict[str, Any]) -> dict[str, Any]:
-        if name == "launch_app":
-            return self._launch_app(params)
-        if name == "list_windows":
-            return self._list_windows()
-        if name == "focus_window":
-            return self._focus_window(params)
-        if name == "click":
-            return self._click(params)
-        if name == "type_text":
-            return self._type_text(params)
-        if name == "scroll":
-            return self._scroll(params)
-        if name == "screenshot":
-            return self._screenshot()
-        if name == "get_bytes":
-            return self._get_bytes(params)
-        if name == "perceive":
-            return self._perceive(params)
-        if name == "reason":
-            return self._reason(params)
+        handler = self._sync_handlers.get(name)
+        if handler is not None:
+            return handler(params)
+        async_handler = self._async_handlers.get(name)
+        if async_handler is not None:
+            return asyncio.run_coroutine_threadsafe(async_handler(params), self._background_loop()).result()
         raise ValueError(f"Unsupported tool: {name}")
 
+    def _background_loop(self) -> asyncio.AbstractEventLoop:
+        with self._loop_lock:
+            loop = self._loop
+            if loop is None:
+                loop = self._loop = asyncio.new_event_loop()
+                threading.Thread(target=loop.run_forever, name="tool-loop", daemon=True).start()
+            return loop
+
+    async def execute_async(self, name: str, params: Dict[str, Any]) -> dict[str, Any]:
+        """Awaitable variant of :meth:`execute` for callers running inside an event loop."""
+
+        async_handler = self._async_handlers.get(name)
+        if async_handler is not None:
+            return await async_handler(params)
+        handler = self._sync_handlers.get(name)
+        if handler is None:
+            raise ValueError(f"Unsupported tool: {name}")
+        return await self._run_blocking(handler, params)
+
+    def bind(self, name: str) -> Callable[[Dict[str, Any]], Awaitable[dict[str, Any]]]:
+        """Resolve ``name`` once and return an awaitable handler that takes the tool params."""
+
+        async_handler = self._async_handlers.get(name)
+        if async_handler is not None:
+            return async_handler
+        handler = self._sync_handlers.get(name)
+        if handler is None:
+            raise ValueError(f"Unsupported tool: {name}")
+
+        async def run(params: Dict[str, Any]) -> dict[str, Any]:
+            return await self._run_blocking(handler, params)
+
+        return run
+
+    async def _run_blocking(self, func: Any, *args: Any, **kwargs: Any) -> Any:
+        pool = self._pool
+        if pool is None:
+            pool = self._pool = ThreadPoolExecutor(max_workers=self._max_workers, thread_name_prefix="tool")
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(pool, partial(func, *args, **kwargs))
+
     def _launch_app(self, params: Dict[str, Any]) -> dict[str, Any]:
         target = params.get("target", "").strip()
         check = self.safety_guard.validate_launch_target(target)
@@ -68,7 +150,7 @@ class ToolExecutor:
 
     def _focus_window(self, params: Dict[str, Any]) -> dict[str, Any]:
         title = params.get("title", "")
-        result = self.controller.focus_window(title)
+        result = self.controller.focus_window(title, params.get("match", "contains"))
         return {"success": result.success, "message": result.message}
 
     def _click(self, params: Dict[str, Any]) -> dict[str, Any]:
@@ -80,7 +162,7 @@ class ToolExecutor:
         check = self.safety_guard.validate_text(text)
         if not check.allowed:
             return {"success": False, "error": check.reason}
-        result = self.controller.type_text(text)
+        result = self.controller.type_text(text, bool(params.get("enter", False)))
         return {"success": result.success, "message": result.message}
 
     def _scroll(self, params: Dict[str, Any]) -> dict[str, Any]:
@@ -100,15 +182,17 @@ class ToolExecutor:
             return {"success": False, "error": "File path is required"}
 
         path = Path(raw_path).expanduser().resolve()
-        if not path.exists():
-            return {"success": False, "error": f"File not found: {path}"}
-        if not path.is_file():
-            return {"success": False, "error": f"Path is not a file: {path}"}
-
+        # One stat answers existence, file type and size
         try:
-            size = path.stat().st_size
+            stat = path.stat()
+        except (FileNotFoundError, NotADirectoryError):
+            # Both meant "not found" when this was checked with Path.exists()
+            return {"success": False, "error": f"File not found: {path}"}
         except OSError as exc:  # noqa: BLE001
             return {"success": False, "error": f"Unable to read file metadata: {exc}"}
+        if not S_ISREG(stat.st_mode):
+            return {"success": False, "error": f"Path is not a file: {path}"}
+        size = stat.st_size
 
         if size > self.max_read_size:
             return {
@@ -117,41 +201,71 @@ class ToolExecutor:
             }
 
         try:
-            content = path.read_bytes()
+            if size:
+                encoded = _read_base64(path, stat.st_mtime_ns, size)
+            else:
+                # procfs/sysfs files report size 0 yet have content that changes between reads,
+                # so they bypass the cache and the size limit is applied to what is actually read
+                with path.open("rb") as handle:
+                    content = handle.read(self.max_read_size + 1)
+                size = len(content)
+                if size > self.max_read_size:
+                    return {
+                        "success": False,
+                        "error": f"File is too large to read safely (limit={self.max_read_size} bytes)",
+                    }
+                encoded = b64encode_ascii(content)
         except OSError as exc:  # noqa: BLE001
             return {"success": False, "error": f"Unable to read file: {exc}"}
 
-        encoded = base64.b64encode(content).decode("ascii")
         return {
             "success": True,
             "message": "File bytes encoded",
             "data": {"path": str(path), "size": size, "base64_data": encoded},
         }
 
-    def _perceive(self, params: Dict[str, Any]) -> dict[str, Any]:
+    async def _perceive(self, params: Dict[str, Any]) -> dict[str, Any]:
         if not self.ai_client:
             return {"success": False, "error": "AI capabilities not available"}
 
-        # Take a screenshot first
-        screenshot_result = self.controller.screenshot()
+        # Take a screenshot first, off the event loop
+        # The vision model takes raw bytes, so skip the base64 text encoding
+        # On the first call, Ollama loads the model while the screen is captured
+        screenshot_result, _ = await asyncio.gather(
+            self._run_blocking(self.controller.screenshot, encode_base64=False, max_edge=self.vision_max_edge),
+            self.ai_client.warm_up(),
+        )
         if not screenshot_result.success or not screenshot_result.data:
             return {"success": False, "error": f"Failed to take screenshot: {screenshot_result.message}"}
 
-        image_data = screenshot_result.data.get("base64_data")
+        image_data = screenshot_result.data.get("image_bytes") or screenshot_result.data.get("base64_data")
         if not image_data:
-            return {"success": False, "error": "No base64 image data available from screenshot"}
+            return {"success": False, "error": "No image data available from screenshot"}
 
         instruction = params.get("instruction", "")
 
-        analysis = self.ai_client.analyze_image(image_data, instruction)
-        return {"success": True, "message": "Screen analyzed", "analysis": analysis}
+        analysis = await self.ai_client.analyze_image(image_data, instruction)
+
+        # Coordinates in the analysis refer to the (possibly downscaled) image
+        coordinate_scale = 1.0
+        original_size = screenshot_result.data.get("original_size")
+        resized_to = screenshot_result.data.get("resized_to")
+        if original_size and resized_to:
+            coordinate_scale = original_size[0] / resized_to[0]
+
+        return {
+            "success": True,
+            "message": "Screen analyzed",
+            "analysis": analysis,
+            "coordinate_scale": coordinate_scale,
+        }
 
-    def _reason(self, params: Dict[str, Any]) -> dict[str, Any]:
+    async def _reason(self, params: Dict[str, Any]) -> dict[str, Any]:
         if not self.ai_client:
             return {"success": False, "error": "AI capabilities not available"}
 
         analysis = params.get("analysis", "")
         goal = params.get("goal", "")
 
-        plan = self.ai_client.plan_action(analysis, goal)
+        plan = await self.ai_client.plan_action(analysis, goal)
         return {"success": True, "message": "Action planned", "plan": plan}
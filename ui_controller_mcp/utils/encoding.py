@@ -0,0 +1,17 @@
+from __future__ import annotations
+
+import base64
+from typing import Any
+
+try:
+    # Optional SIMD base64 encoder; several times faster on multi-megabyte payloads
+    import pybase64
+except ImportError:  # pragma: no cover - depends on the environment
+    pybase64 = None
+
+
+def b64encode_ascii(data: Any) -> str:
+    """Base64-encode bytes or any buffer (e.g. a memoryview) straight to an ASCII str."""
+    if pybase64 is not None:
+        return pybase64.b64encode_as_string(data)
+    return base64.b64encode(data).decode("ascii")
@@ -0,0 +1,10 @@
+from __future__ import annotations
+
+import os
+
+_TRUTHY = frozenset({"1", "true", "yes"})
+
+
+def env_flag(name: str) -> bool:
+    """Whether the environment variable ``name`` is set to 1, true or yes (case-insensitive)."""
+    return os.getenv(name, "").strip().lower() in _TRUTHY